@@ -1,8 +1,80 @@
 """Core game state and logic for the type racer."""
 
+import queue
+import threading
 import time
-from typing import List, Optional
-from typeracer.quotes import fetch_quote, QuoteFetchError
+from array import array
+from collections import namedtuple
+from typing import Dict, List, Optional, Set, Tuple
+from typeracer.quotes import fetch_quote, offline_quote, Quote, QuoteFetchError
+
+
+# Race statistics computed together at a single point in time
+Stats = namedtuple(
+    "Stats",
+    ["wpm", "raw_wpm", "accuracy", "elapsed", "progress", "correct_chars"],
+)
+
+# How long reset() waits for a prefetched quote before showing the error
+# screen. This is a limit on the player's wait, not on the fetch: the 3
+# second socket timeout applies to each connect and read, and fetch_quote
+# may open up to three connections (a reconnect after a dropped kept-alive
+# one, then an unverified SSL retry), so a slow server can take longer.
+# The fetch keeps running and the next retry picks up its quote.
+PREFETCH_WAIT = 6.0
+
+
+class _QuotePrefetcher:
+    """Fetches the next quote on a background thread.
+
+    Once started, one quote is always fetched ahead of time so a new race
+    can begin while the player is still reading their results. If the API
+    cannot be reached, a bundled offline quote is queued instead.
+    """
+
+    def __init__(self):
+        self._queue: "queue.Queue[Quote]" = queue.Queue(maxsize=1)
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def is_started(self) -> bool:
+        return self._thread is not None
+
+    def start(self):
+        """Begin fetching the first quote, if not already started."""
+        if self._thread is None:
+            self._fetch_next()
+
+    def _fetch_next(self):
+        self._thread = threading.Thread(target=self._worker, daemon=True)
+        self._thread.start()
+
+    def _worker(self):
+        try:
+            quote = fetch_quote()
+        except QuoteFetchError:
+            quote = offline_quote()
+        self._queue.put(quote)
+
+    def get(self, timeout: float) -> Quote:
+        """Return the prefetched quote and start fetching the next one.
+
+        Raises QuoteFetchError if the fetch did not finish in time.
+        """
+        try:
+            quote = self._queue.get(timeout=timeout)
+        except queue.Empty:
+            raise QuoteFetchError("Timed out waiting for a quote") from None
+        self._fetch_next()
+        return quote
+
+
+_prefetcher = _QuotePrefetcher()
+
+
+def start_prefetch():
+    """Start fetching quotes in the background so races never wait on I/O."""
+    _prefetcher.start()
 
 
 class GameState:
@@ -11,21 +83,76 @@ class GameState:
     def __init__(self):
         self.target: str = ""
         self.author: str = ""
-        self.typed: List[str] = []
+        # Typed characters as ASCII codes, compared against _target_bytes
+        self.typed: bytearray = bytearray()
+        self._target_bytes: bytes = b""
+        self._target_len: int = 0
         self.start_time: Optional[float] = None
         self.end_time: Optional[float] = None
         self.total_keystrokes: int = 0
+        # Indices of typed characters that do not match the target, kept
+        # up to date on every keystroke so nothing has to rescan typed
+        self.mismatch_positions: Set[int] = set()
+        # Lowest index in mismatch_positions, or None when there is none
+        self._first_mismatch: Optional[int] = None
+        # Progress and accuracy percentages, updated on every keystroke
+        self._progress: float = 0.0
+        self._accuracy: float = 100.0
+        # Word-wrapped lines and per-char row and column offsets, keyed by
+        # the text area width. Filled in by the UI, cleared on reset and resize.
+        self._wrap_cache: Dict[int, Tuple[List[str], array, array]] = {}
+        # The UI's game screen geometry for the last terminal size drawn at
+        self._layout: Optional[tuple] = None
+        # What the UI last put on screen, so it can repaint only the damage.
+        # _subwins holds the curses windows the game screen is split into;
+        # None means the next draw must create them and repaint everything.
+        # _dirty_from is the lowest typed index changed since the last draw.
+        self._subwins: Optional[tuple] = None
+        self._last_drawn_typed_len: int = 0
+        self._last_stats: str = ""
+        self._last_stats_time: float = 0.0
+        # True when a keystroke arrived too soon after the last stats
+        # rebuild and the line still shows older numbers
+        self._stats_pending: bool = False
+        self._last_filled: int = 0
+        self._dirty_from: int = 0
         self.reset()
 
     def reset(self):
         """Reset for a new game with a fresh quote."""
-        quote = fetch_quote()
+        if _prefetcher.is_started:
+            quote = _prefetcher.get(timeout=PREFETCH_WAIT)
+        else:
+            quote = fetch_quote()
         self.target = quote.content
         self.author = quote.author
-        self.typed = []
+        # One byte per target character. Characters outside ASCII can never
+        # be typed, so they map to NUL and never match a keystroke.
+        self._target_bytes = bytes(
+            ord(c) if ord(c) < 128 else 0 for c in self.target
+        )
+        self._target_len = len(self.target)
+        self.typed = bytearray()
         self.start_time = None
         self.end_time = None
         self.total_keystrokes = 0
+        self.mismatch_positions = set()
+        self._first_mismatch = None
+        self._progress = 0.0
+        self._accuracy = 100.0
+        self.invalidate_layout()
+
+    def invalidate_layout(self):
+        """Drop cached layout so the next draw repaints from scratch."""
+        self._wrap_cache = {}
+        self._layout = None
+        self._subwins = None
+        self._last_drawn_typed_len = 0
+        self._last_stats = ""
+        self._last_stats_time = 0.0
+        self._stats_pending = False
+        self._last_filled = 0
+        self._dirty_from = 0
 
     @property
     def is_started(self) -> bool:
@@ -33,13 +160,13 @@ class GameState:
 
     @property
     def is_finished(self) -> bool:
-        return len(self.typed) >= len(self.target)
+        return len(self.typed) >= self._target_len
 
     @property
     def elapsed_seconds(self) -> float:
         if self.start_time is None:
             return 0.0
-        end = self.end_time if self.end_time else time.time()
+        end = self.end_time if self.end_time else time.monotonic()
         return end - self.start_time
 
     @property
@@ -51,11 +178,7 @@ class GameState:
         """Words per minute (standard: 5 chars = 1 word)."""
         if self.elapsed_minutes <= 0:
             return 0.0
-        correct_chars = sum(
-            1 for i, ch in enumerate(self.typed)
-            if i < len(self.target) and ch == self.target[i]
-        )
-        return (correct_chars / 5.0) / self.elapsed_minutes
+        return (self.correct_chars / 5.0) / self.elapsed_minutes
 
     @property
     def raw_wpm(self) -> float:
@@ -67,43 +190,93 @@ class GameState:
     @property
     def accuracy(self) -> float:
         """Accuracy percentage."""
-        if self.total_keystrokes == 0:
-            return 100.0
-        correct = sum(
-            1 for i, ch in enumerate(self.typed)
-            if i < len(self.target) and ch == self.target[i]
-        )
-        return (correct / self.total_keystrokes) * 100.0
+        return self._accuracy
 
     @property
     def correct_chars(self) -> int:
-        return sum(
-            1 for i, ch in enumerate(self.typed)
-            if i < len(self.target) and ch == self.target[i]
-        )
+        return len(self.typed) - len(self.mismatch_positions)
+
+    @property
+    def correct_prefix_len(self) -> int:
+        """Length of the leading run of typed text that matches the target."""
+        if self._first_mismatch is None:
+            return len(self.typed)
+        return self._first_mismatch
 
     @property
     def progress(self) -> float:
         """Progress percentage."""
-        if len(self.target) == 0:
-            return 0.0
-        return (len(self.typed) / len(self.target)) * 100.0
+        return self._progress
+
+    def snapshot(self, now: float) -> Stats:
+        """Compute all race statistics as of now (a time.monotonic() value).
+
+        Lets a screen read the clock once instead of once per property.
+        """
+        if self.start_time is None:
+            elapsed = 0.0
+        else:
+            end = self.end_time if self.end_time else now
+            elapsed = end - self.start_time
+        minutes = elapsed / 60.0
+        correct_chars = self.correct_chars
+        if minutes > 0:
+            wpm = (correct_chars / 5.0) / minutes
+            raw_wpm = (len(self.typed) / 5.0) / minutes
+        else:
+            wpm = raw_wpm = 0.0
+        return Stats(
+            wpm=wpm,
+            raw_wpm=raw_wpm,
+            accuracy=self.accuracy,
+            elapsed=elapsed,
+            progress=self.progress,
+            correct_chars=correct_chars,
+        )
 
     def type_char(self, char: str):
-        """Register a typed character."""
+        """Register a typed ASCII character."""
+        self.type_char_byte(ord(char))
+
+    def type_char_byte(self, code: int):
+        """Register a typed character given as its ASCII code."""
         if self.is_finished:
             return
 
         if self.start_time is None:
-            self.start_time = time.time()
+            self.start_time = time.monotonic()
 
-        self.typed.append(char)
+        i = len(self.typed)
+        if code != self._target_bytes[i]:
+            self.mismatch_positions.add(i)
+            if self._first_mismatch is None:
+                self._first_mismatch = i
+        self._dirty_from = min(self._dirty_from, i)
+        self.typed.append(code)
         self.total_keystrokes += 1
+        self._update_percentages()
 
         if self.is_finished:
-            self.end_time = time.time()
+            self.end_time = time.monotonic()
 
     def backspace(self):
-        """Delete the last typed character."""
-        if self.typed:
-            self.typed.pop()
+        """Delete the last typed character, unless the race is over."""
+        if self.typed and self.end_time is None:
+            i = len(self.typed) - 1
+            self.mismatch_positions.discard(i)
+            # Only the last character is ever removed, so deleting the
+            # first mismatch leaves none behind it or before it
+            if i == self._first_mismatch:
+                self._first_mismatch = None
+            self._dirty_from = min(self._dirty_from, i)
+            del self.typed[-1:]
+            self._update_percentages()
+
+    def _update_percentages(self):
+        """Recompute progress and accuracy after the typed text changed."""
+        typed_len = len(self.typed)
+        self._progress = (typed_len / self._target_len * 100.0
+                          if self._target_len else 0.0)
+        self._accuracy = ((typed_len - len(self.mismatch_positions))
+                          / self.total_keystrokes * 100.0
+                          if self.total_keystrokes else 100.0)
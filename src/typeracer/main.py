@@ -2,21 +2,90 @@
 
 import curses
 import sys
-from typeracer.game import GameState
+from typeracer.game import GameState, start_prefetch
 from typeracer.quotes import QuoteFetchError
 from typeracer.ui import (
     init_colors, draw_welcome, draw_game, draw_results, draw_error,
+    stats_due_in,
 )
 
 
+# Seconds between stats refreshes while the typist is idle
+STATS_TICK = 1.0
+
+# Non-zero for the key codes that type a character (printable ASCII)
+_PRINTABLE_MASK = bytes(1 if 32 <= i <= 126 else 0 for i in range(256))
+
+
+def next_tick_timeout(game: GameState) -> int:
+    """Milliseconds to wait for input before the stats need a refresh.
+
+    Before the race starts nothing on screen changes on its own, so this
+    returns -1 to block until a key arrives. A stats update deferred by
+    the draw rate limit shortens the wait so it is shown in time.
+    """
+    if not game.is_started:
+        return -1
+    remaining = STATS_TICK - (game.elapsed_seconds % STATS_TICK)
+    pending = stats_due_in(game)
+    if pending is not None:
+        remaining = min(remaining, pending)
+    return max(1, int(remaining * 1000))
+
+
+def _quit(game: GameState, key: int) -> bool:
+    return True
+
+
+def _backspace(game: GameState, key: int) -> bool:
+    game.backspace()
+    return False
+
+
+def _resize(game: GameState, key: int) -> bool:
+    # Terminal resized, re-wrap and repaint on the next draw
+    game.invalidate_layout()
+    return False
+
+
+def _ignore(game: GameState, key: int) -> bool:
+    return False
+
+
+def _type_key(game: GameState, key: int) -> bool:
+    if 0 <= key < 256 and _PRINTABLE_MASK[key]:
+        game.type_char_byte(key)
+    return False
+
+
+# Race key handlers by key code. Each returns True to quit the game.
+# Keys not listed here go to _type_key.
+_KEY_ACTIONS = {
+    -1: _ignore,  # getch timeout
+    27: _quit,  # ESC
+    curses.KEY_BACKSPACE: _backspace,
+    127: _backspace,
+    8: _backspace,
+    curses.KEY_RESIZE: _resize,
+}
+
+
 def game_loop(stdscr):
     """Main game loop driven by curses."""
     # Setup
     curses.curs_set(0)  # Hide cursor
     stdscr.nodelay(False)
     stdscr.keypad(True)
+    # The cursor is hidden and drawn as a colored cell, so curses need not
+    # move the real one back after each update; idlok lets it use line
+    # insert/delete when that is cheaper than redrawing rows
+    stdscr.leaveok(True)
+    stdscr.idlok(True)
     init_colors()
 
+    # Fetch the first quote while the welcome screen is up
+    start_prefetch()
+
     # Welcome screen (shown only once)
     draw_welcome(stdscr)
     key = stdscr.getch()
@@ -37,25 +106,32 @@ def game_loop(stdscr):
                     return
                 # Any other key retries
 
-        # Enable timeout so we can refresh stats while waiting for input
-        stdscr.timeout(100)  # 100ms refresh
-
+        needs_draw = True
+        last_tenth = -1
         while not game.is_finished:
-            draw_game(stdscr, game)
+            if needs_draw:
+                draw_game(stdscr, game)
+                last_tenth = int(game.elapsed_seconds * 10)
+            # Wake up only when the stats line is due for a refresh
+            stdscr.timeout(next_tick_timeout(game))
             key = stdscr.getch()
-
-            if key == -1:
-                # Timeout, just refresh
-                continue
-            elif key == 27:  # ESC
+            if _KEY_ACTIONS.get(key, _type_key)(game, key):
                 return
-            elif key in (curses.KEY_BACKSPACE, 127, 8):
-                game.backspace()
-            elif key == curses.KEY_RESIZE:
-                # Terminal resized, just redraw
+            if key == -1:
+                # On a timeout the stats only change once the clock reaches
+                # a new tenth of a second, or when an update was deferred
+                needs_draw = (int(game.elapsed_seconds * 10) != last_tenth
+                              or stats_due_in(game) is not None)
                 continue
-            elif 32 <= key <= 126:
-                game.type_char(chr(key))
+
+            # Handle keys already queued behind this one before redrawing,
+            # so a burst of input (paste, key repeat) costs a single frame.
+            # Keys after the one that finishes the race are left unread.
+            stdscr.timeout(0)
+            while not game.is_finished and (queued := stdscr.getch()) != -1:
+                if _KEY_ACTIONS.get(queued, _type_key)(game, queued):
+                    return
+            needs_draw = True
 
         # Show final state
         draw_game(stdscr, game)
@@ -1,16 +1,64 @@
 """Collection of typing passages for the type racer game."""
 
+import http.client
 import json
+import random
+import re
+import socket
 import ssl
-import urllib.request
-import urllib.error
 from collections import namedtuple
+from typing import List, Optional
 
 
-API_URL = "https://api.quotable.io/random?minLength=40&maxLength=150"
+API_HOST = "api.quotable.io"
+API_PATH = "/random?minLength=40&maxLength=150"
+API_URL = f"https://{API_HOST}{API_PATH}"
 
 Quote = namedtuple("Quote", ["content", "author"])
 
+# Played when the API cannot be reached. Plain ASCII only, so every
+# character can be typed.
+QUOTES: List[Quote] = [
+    Quote("The only way to do great work is to love what you do.",
+          "Steve Jobs"),
+    Quote("In the middle of every difficulty lies opportunity.",
+          "Albert Einstein"),
+    Quote("It does not matter how slowly you go as long as you do not stop.",
+          "Confucius"),
+    Quote("Simplicity is prerequisite for reliability.",
+          "Edsger W. Dijkstra"),
+    Quote("Programs must be written for people to read, and only "
+          "incidentally for machines to execute.", "Harold Abelson"),
+    Quote("The best way to predict the future is to invent it.",
+          "Alan Kay"),
+    Quote("Premature optimization is the root of all evil.",
+          "Donald Knuth"),
+    Quote("We are what we repeatedly do. Excellence, then, is not an act, "
+          "but a habit.", "Will Durant"),
+    Quote("Any fool can write code that a computer can understand. Good "
+          "programmers write code that humans can understand.",
+          "Martin Fowler"),
+    Quote("Life is what happens when you're busy making other plans.",
+          "John Lennon"),
+    Quote("The journey of a thousand miles begins with one step.",
+          "Lao Tzu"),
+    Quote("First, solve the problem. Then, write the code.",
+          "John Johnson"),
+    Quote("Imagination is more important than knowledge.",
+          "Albert Einstein"),
+    Quote("Success is not final, failure is not fatal: it is the courage to "
+          "continue that counts.", "Winston Churchill"),
+]
+
+# The API answers with a small flat JSON object, so the two fields we need
+# are pulled out directly. Anything unusual falls back to json.loads.
+_CONTENT_RE = re.compile(rb'"content"\s*:\s*"((?:[^"\\]|\\.)*)"')
+_AUTHOR_RE = re.compile(rb'"author"\s*:\s*"((?:[^"\\]|\\.)*)"')
+
+# Kept open across races so only the first quote pays for the TCP and TLS
+# handshakes. Created lazily and dropped whenever a request fails.
+_conn: Optional[http.client.HTTPSConnection] = None
+
 
 class QuoteFetchError(Exception):
     """Raised when a quote cannot be fetched from the API."""
@@ -20,6 +68,86 @@ class QuoteFetchError(Exception):
         super().__init__(reason)
 
 
+def _unverified_context() -> ssl.SSLContext:
+    """SSL context that skips certificate checks."""
+    ctx = ssl.create_default_context()
+    ctx.check_hostname = False
+    ctx.verify_mode = ssl.CERT_NONE
+    return ctx
+
+
+def offline_quote() -> Quote:
+    """Return a random quote from the bundled QUOTES list."""
+    return random.choice(QUOTES)
+
+
+def _json_string(raw: bytes) -> str:
+    """Decode the body of a JSON string literal."""
+    if b"\\" in raw:
+        return json.loads(b'"' + raw + b'"')
+    return raw.decode("utf-8")
+
+
+def _parse_quote(body: bytes) -> Quote:
+    """Extract a Quote from the API response body."""
+    content_match = _CONTENT_RE.search(body)
+    if content_match:
+        author_match = _AUTHOR_RE.search(body)
+        content = _json_string(content_match.group(1))
+        author = _json_string(author_match.group(1)) if author_match else ""
+    else:
+        data = json.loads(body.decode("utf-8"))
+        content = data.get("content", "")
+        author = data.get("author", "")
+    content = content.strip()
+    author = author.strip()
+    if content:
+        return Quote(content=content, author=author or "Unknown")
+    raise QuoteFetchError("API returned an empty quote")
+
+
+def _close_connection():
+    global _conn
+    if _conn is not None:
+        _conn.close()
+        _conn = None
+
+
+def _request(context: Optional[ssl.SSLContext] = None) -> bytes:
+    """GET the API path over the shared connection and return the body.
+
+    context is used if a new connection has to be opened.
+    """
+    global _conn
+    # A kept-alive connection may have been closed by the server while
+    # idle; in that case reconnect and try once more.
+    for attempt in range(2):
+        reused = _conn is not None
+        if _conn is None:
+            _conn = http.client.HTTPSConnection(API_HOST, timeout=3,
+                                                context=context)
+        try:
+            _conn.request("GET", API_PATH,
+                          headers={"Accept": "application/json"})
+            resp = _conn.getresponse()
+            body = resp.read()
+        except (ConnectionError, http.client.HTTPException):
+            _close_connection()
+            if reused and attempt == 0:
+                continue
+            raise
+        except Exception:
+            _close_connection()
+            raise
+        if resp.will_close:
+            # The server is closing its end; start the next fetch on a
+            # fresh connection rather than failing on this one first
+            _close_connection()
+        if resp.status != 200:
+            raise QuoteFetchError(f"Network error: HTTP {resp.status}")
+        return body
+
+
 def fetch_quote() -> Quote:
     """Fetch a random quote from the Quotable API.
 
@@ -28,32 +156,24 @@ def fetch_quote() -> Quote:
     Uses a short timeout so the game never hangs.
     """
     try:
-        req = urllib.request.Request(API_URL, headers={"Accept": "application/json"})
         # Try with default SSL context first
         try:
-            resp = urllib.request.urlopen(req, timeout=3)
-        except (ssl.SSLCertVerificationError, urllib.error.URLError):
+            body = _request()
+        except ssl.SSLCertVerificationError:
             # Fall back to unverified SSL if certs are outdated
-            # (common on macOS system Python where certs are not installed)
-            ctx = ssl.create_default_context()
-            ctx.check_hostname = False
-            ctx.verify_mode = ssl.CERT_NONE
-            req = urllib.request.Request(
-                API_URL, headers={"Accept": "application/json"}
-            )
-            resp = urllib.request.urlopen(req, timeout=3, context=ctx)
-
-        data = json.loads(resp.read().decode("utf-8"))
-        resp.close()
-        content = data.get("content", "").strip()
-        author = data.get("author", "").strip()
-        if content:
-            return Quote(content=content, author=author or "Unknown")
-        raise QuoteFetchError("API returned an empty quote")
+            # (common on macOS system Python where certs are not installed).
+            # Only this fetch goes unverified; the connection is dropped
+            # afterwards so the next one checks certificates again.
+            try:
+                body = _request(_unverified_context())
+            finally:
+                _close_connection()
+
+        return _parse_quote(body)
     except QuoteFetchError:
         raise
-    except urllib.error.URLError as e:
-        raise QuoteFetchError(f"Network error: {e.reason}") from e
+    except (ConnectionError, socket.gaierror, http.client.HTTPException) as e:
+        raise QuoteFetchError(f"Network error: {e}") from e
     except OSError as e:
         raise QuoteFetchError(f"Connection failed: {e}") from e
     except (json.JSONDecodeError, KeyError, ValueError) as e:
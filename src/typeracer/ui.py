@@ -1,7 +1,12 @@
 """Curses-based terminal UI for the type racer game."""
 
 import curses
-from typing import List, Tuple
+import time
+from array import array
+from bisect import bisect_left
+from collections import namedtuple
+from functools import lru_cache
+from typing import List, Optional, Tuple
 from typeracer.game import GameState
 
 
@@ -24,9 +29,38 @@ TOP_RIGHT = "╮"
 BOTTOM_LEFT = "╰"
 BOTTOM_RIGHT = "╯"
 
+# Seconds the stats line is left alone between keystroke redraws
+STATS_MIN_INTERVAL = 0.1
+
+# Progress bar halves, built once at more than the widest bar and sliced
+_BAR_FULL = "█" * 200
+_BAR_EMPTY = "░" * 200
+
+# Combined color pair and style attributes, filled in by init_colors()
+ATTR_CORRECT = 0
+ATTR_INCORRECT = 0
+ATTR_UNTYPED = 0
+ATTR_CURSOR = 0
+ATTR_TEXT_BG = 0
+ATTR_TITLE = 0
+ATTR_BAR = 0
+ATTR_STATS = 0
+ATTR_DIM = 0
+ATTR_DIM_BORDER = 0
+ATTR_AUTHOR = 0
+ATTR_HIGHLIGHT = 0
+ATTR_PROMPT = 0
+ATTR_UNTYPED_BOLD = 0
+ATTR_DIM_BOLD = 0
+
 
 def init_colors():
-    """Initialize color pairs."""
+    """Initialize color pairs and the ATTR_* constants built from them."""
+    global ATTR_CORRECT, ATTR_INCORRECT, ATTR_UNTYPED, ATTR_CURSOR
+    global ATTR_TEXT_BG, ATTR_TITLE, ATTR_BAR, ATTR_STATS, ATTR_DIM
+    global ATTR_DIM_BORDER, ATTR_AUTHOR, ATTR_HIGHLIGHT, ATTR_PROMPT
+    global ATTR_UNTYPED_BOLD, ATTR_DIM_BOLD
+
     curses.start_color()
     curses.use_default_colors()
 
@@ -47,29 +81,82 @@ def init_colors():
     curses.init_pair(PAIR_HIGHLIGHT, curses.COLOR_MAGENTA, -1)
     curses.init_pair(PAIR_TEXT_BG, curses.COLOR_WHITE, TEXT_BG)
 
+    ATTR_CORRECT = curses.color_pair(PAIR_CORRECT) | curses.A_BOLD
+    ATTR_INCORRECT = curses.color_pair(PAIR_INCORRECT) | curses.A_BOLD
+    ATTR_UNTYPED = curses.color_pair(PAIR_UNTYPED) | curses.A_DIM
+    ATTR_CURSOR = curses.color_pair(PAIR_CURSOR)
+    ATTR_TEXT_BG = curses.color_pair(PAIR_TEXT_BG)
+    ATTR_TITLE = curses.color_pair(PAIR_TITLE) | curses.A_BOLD
+    ATTR_BAR = curses.color_pair(PAIR_TITLE)
+    ATTR_STATS = curses.color_pair(PAIR_STATS) | curses.A_BOLD
+    ATTR_DIM = curses.color_pair(PAIR_DIM)
+    ATTR_DIM_BORDER = curses.color_pair(PAIR_DIM) | curses.A_DIM
+    ATTR_AUTHOR = curses.color_pair(PAIR_DIM) | curses.A_ITALIC
+    ATTR_HIGHLIGHT = curses.color_pair(PAIR_HIGHLIGHT) | curses.A_BOLD
+    ATTR_PROMPT = (curses.color_pair(PAIR_HIGHLIGHT)
+                   | curses.A_BOLD | curses.A_BLINK)
+    ATTR_UNTYPED_BOLD = curses.color_pair(PAIR_UNTYPED) | curses.A_BOLD
+    ATTR_DIM_BOLD = curses.color_pair(PAIR_DIM) | curses.A_BOLD
+
+    # Screen plans embed these attributes
+    _welcome_plan.cache_clear()
+    _error_plan.cache_clear()
+    _results_plan.cache_clear()
+
+
+# Strings repeated every frame are built once per size and reused
+
+@lru_cache(maxsize=64)
+def _hbar(width: int) -> str:
+    """Return a horizontal rule of the given width."""
+    return HORIZONTAL * width
+
+
+@lru_cache(maxsize=64)
+def _spaces(width: int) -> str:
+    """Return a run of blanks of the given width."""
+    return " " * width
+
+
+@lru_cache(maxsize=64)
+def _box_top(width: int) -> str:
+    """Return the top border of a box of the given width."""
+    return TOP_LEFT + _hbar(width - 2) + TOP_RIGHT
+
+
+@lru_cache(maxsize=64)
+def _box_bottom(width: int) -> str:
+    """Return the bottom border of a box of the given width."""
+    return BOTTOM_LEFT + _hbar(width - 2) + BOTTOM_RIGHT
+
+
+@lru_cache(maxsize=64)
+def _progress_bar(filled: int, width: int) -> str:
+    """Return a progress bar with filled of width cells complete."""
+    return _BAR_FULL[:filled] + _BAR_EMPTY[:width - filled]
+
 
 def draw_box(stdscr, y: int, x: int, width: int, height: int):
     """Draw a rounded box."""
     # Top border
-    stdscr.addstr(y, x, TOP_LEFT + HORIZONTAL * (width - 2) + TOP_RIGHT,
-                  curses.color_pair(PAIR_DIM) | curses.A_DIM)
+    stdscr.addstr(y, x, _box_top(width), ATTR_DIM_BORDER)
     # Bottom border
-    stdscr.addstr(y + height - 1, x,
-                  BOTTOM_LEFT + HORIZONTAL * (width - 2) + BOTTOM_RIGHT,
-                  curses.color_pair(PAIR_DIM) | curses.A_DIM)
+    stdscr.addstr(y + height - 1, x, _box_bottom(width), ATTR_DIM_BORDER)
     # Side borders
     for row in range(1, height - 1):
-        stdscr.addstr(y + row, x, VERTICAL,
-                      curses.color_pair(PAIR_DIM) | curses.A_DIM)
-        stdscr.addstr(y + row, x + width - 1, VERTICAL,
-                      curses.color_pair(PAIR_DIM) | curses.A_DIM)
+        stdscr.addstr(y + row, x, VERTICAL, ATTR_DIM_BORDER)
+        stdscr.addstr(y + row, x + width - 1, VERTICAL, ATTR_DIM_BORDER)
 
 
-def draw_welcome(stdscr):
-    """Draw the welcome/start screen."""
-    stdscr.clear()
-    h, w = stdscr.getmaxyx()
+# A screen plan is the (y, x, text, attr) of every string on a static
+# screen. Plans only depend on their arguments, so they are cached and
+# redrawing the same screen just replays the writes.
+_Plan = Tuple[Tuple[int, int, str, int], ...]
+
 
+@lru_cache(maxsize=32)
+def _welcome_plan(h: int, w: int) -> _Plan:
+    """Lay out the welcome/start screen."""
     logo = [
         "╔╦╗╦ ╦╔═╗╔═╗╦═╗╔═╗╔═╗╔═╗╦═╗",
         " ║ ╚╦╝╠═╝║╣ ╠╦╝╠═╣║  ║╣ ╠╦╝",
@@ -80,14 +167,13 @@ def draw_welcome(stdscr):
     start_x = max(0, (w - logo_width) // 2)
     start_y = max(0, h // 2 - 6)
 
-    for i, line in enumerate(logo):
-        stdscr.addstr(start_y + i, start_x, line,
-                      curses.color_pair(PAIR_TITLE) | curses.A_BOLD)
+    plan = [(start_y + i, start_x, line, ATTR_TITLE)
+            for i, line in enumerate(logo)]
 
     # Tagline
     tagline = "Test your typing speed!"
-    stdscr.addstr(start_y + 5, max(0, (w - len(tagline)) // 2), tagline,
-                  curses.color_pair(PAIR_DIM))
+    plan.append((start_y + 5, max(0, (w - len(tagline)) // 2), tagline,
+                 ATTR_DIM))
 
     # Instructions
     instructions = [
@@ -102,295 +188,496 @@ def draw_welcome(stdscr):
 
     inst_y = start_y + 8
     for i, line in enumerate(instructions):
-        if i == 0:
-            stdscr.addstr(inst_y + i, max(0, (w - len(line)) // 2), line,
-                          curses.color_pair(PAIR_STATS) | curses.A_BOLD)
-        else:
-            stdscr.addstr(inst_y + i, max(0, (w - len(line)) // 2), line,
-                          curses.color_pair(PAIR_DIM))
+        plan.append((inst_y + i, max(0, (w - len(line)) // 2), line,
+                     ATTR_STATS if i == 0 else ATTR_DIM))
 
     # Start prompt
     prompt = "Press any key to start..."
     prompt_y = min(inst_y + len(instructions) + 2, h - 2)
-    stdscr.addstr(prompt_y, max(0, (w - len(prompt)) // 2), prompt,
-                  curses.color_pair(PAIR_HIGHLIGHT) | curses.A_BOLD | curses.A_BLINK)
+    plan.append((prompt_y, max(0, (w - len(prompt)) // 2), prompt,
+                 ATTR_PROMPT))
+    return tuple(plan)
+
+
+def draw_welcome(stdscr):
+    """Draw the welcome/start screen."""
+    stdscr.clear()
+    h, w = stdscr.getmaxyx()
+    for y, x, text, attr in _welcome_plan(h, w):
+        stdscr.addstr(y, x, text, attr)
 
-    stdscr.refresh()
+    stdscr.noutrefresh()
+    curses.doupdate()
 
 
 def wrap_text(text: str, width: int) -> List[str]:
     """Word-wrap text to fit within a given width."""
-    words = text.split(" ")
-    lines = []
-    current_line = ""
-    for word in words:
-        if current_line and len(current_line) + 1 + len(word) > width:
-            lines.append(current_line)
-            current_line = word
-        elif current_line:
-            current_line += " " + word
+    lines: List[str] = []
+    # Each line is a contiguous slice of text, so only its bounds are
+    # tracked while scanning and the string is built once when it is full
+    line_start = line_len = 0
+    i, n = 0, len(text)
+    while i <= n:
+        j = text.find(" ", i)
+        if j == -1:
+            j = n
+        word_len = j - i
+        if not line_len:
+            line_start, line_len = i, word_len
+        elif line_len + 1 + word_len > width:
+            lines.append(text[line_start:line_start + line_len])
+            line_start, line_len = i, word_len
         else:
-            current_line = word
-    if current_line:
-        lines.append(current_line)
+            line_len += 1 + word_len
+        i = j + 1
+    if line_len:
+        lines.append(text[line_start:line_start + line_len])
     return lines
 
 
-def draw_game(stdscr, game: GameState):
-    """Draw the main game screen, centered like the other screens."""
-    stdscr.clear()
+def _wrapped_layout(game: GameState,
+                    width: int) -> Tuple[List[str], array, array]:
+    """Return the wrapped lines and per-char offsets, cached on the game.
+
+    Offsets are stored as two parallel int arrays: the row and the column
+    of each target character relative to the top-left of the text area.
+    """
+    cached = game._wrap_cache.get(width)
+    if cached is not None:
+        return cached
+
+    lines = wrap_text(game.target, width)
+    # Build a flat index map: for each char position in target,
+    # figure out which (row, col) offset it maps to in the text area.
+    # Word-wrapping drops the space at line breaks, so we add it back
+    # at the end of each wrapped line to keep positions aligned with target.
+    char_rows = array("i")
+    char_cols = array("i")
+    for line_num, line in enumerate(lines):
+        # Include the missing space at the wrap boundary (except after the last line)
+        line_len = len(line) + (1 if line_num < len(lines) - 1 else 0)
+        char_rows.extend([line_num * 2] * line_len)
+        char_cols.extend(range(line_len))
+
+    game._wrap_cache[width] = (lines, char_rows, char_cols)
+    return lines, char_rows, char_cols
+
+
+def _room(win, y: int, x: int) -> int:
+    """Return how many cells can be written at (y, x) without curses failing.
+
+    Writing the last cell of a window fails because the cursor cannot move
+    past it, so the bottom row has one cell less than the others.
+    """
+    h, w = win.getmaxyx()
+    if not (0 <= y < h and 0 <= x < w):
+        return 0
+    return w - x - (y == h - 1)
+
+
+def _addstr_clipped(win, y: int, x: int, text: str, attr: int):
+    """Write text at (y, x), cut short where it would leave the window."""
+    room = _room(win, y, x)
+    if room > 0:
+        win.addnstr(y, x, text, room, attr)
+
+
+def _draw_chars(win, game: GameState, start: int, stop: int, text_x: int,
+                char_rows: array, char_cols: array, max_row: int):
+    """Render target characters in [start, stop) into the text window.
+
+    Rows at or beyond max_row and columns past the window edge are
+    clipped. Consecutive characters on the same row with the same
+    attribute are written with a single addnstr call.
+    """
+    win_h, win_w = win.getmaxyx()
+
+    def flush(run_start: int, run_stop: int):
+        # Bounds are checked up front; see _room() for the bottom row
+        room = win_w - run_col - (run_row == win_h - 1)
+        if room > 0:
+            win.addnstr(run_row, run_col, game.target[run_start:run_stop],
+                        room, run_attr)
+
+    # Rows only grow along the target, so the first character that falls
+    # below the window bounds everything left to draw
+    stop = min(stop, bisect_left(char_rows, max_row))
+    typed_len = len(game.typed)
+    correct_prefix = game.correct_prefix_len
+    mismatches = game.mismatch_positions
+    run_start = start
+    run_row = run_col = run_attr = 0
+    for i in range(start, stop):
+        row = char_rows[i]
+        if i < correct_prefix:
+            attr = ATTR_CORRECT
+        elif i < typed_len:
+            attr = ATTR_INCORRECT if i in mismatches else ATTR_CORRECT
+        elif i == typed_len:
+            attr = ATTR_CURSOR
+        else:
+            attr = ATTR_UNTYPED
+        if i > run_start and (attr != run_attr or row != run_row):
+            flush(run_start, i)
+            run_start = i
+        if i == run_start:
+            run_row, run_col, run_attr = row, text_x + char_cols[i], attr
+
+    if run_start < stop:
+        flush(run_start, stop)
+
+
+# Screen geometry of the game screen for the current terminal size
+_GameLayout = namedtuple("_GameLayout", [
+    "h", "w", "center_x", "start_y", "text_area_width", "text_x",
+    "stats_y", "text_y", "text_h", "lines", "char_rows", "char_cols",
+    "bg_spans",
+])
+
+
+def _game_layout(stdscr, game: GameState) -> _GameLayout:
+    """Compute where each part of the game screen goes, cached on the game."""
     h, w = stdscr.getmaxyx()
-    center_x = w // 2
+    cached = game._layout
+    if cached is not None and cached.h == h and cached.w == w:
+        return cached
 
     # Layout dimensions
     text_area_width = min(w - 6, 70)
     text_x = max(3, (w - text_area_width) // 2)
 
     # Word-wrap the target text to calculate total height needed
-    lines = wrap_text(game.target, text_area_width)
+    lines, char_rows, char_cols = _wrapped_layout(game, text_area_width)
     # Total content height: title(1) + sep(1) + stats(1) + bar(1) + sep(1)
     #                        + gap(1) + text lines with spacing + gap(1) + author(1) + hint(1)
     text_lines_height = len(lines) * 2 - 1  # lines with single spacing between
     total_height = 6 + text_lines_height + 4
     start_y = max(1, (h - total_height) // 2)
 
-    y = start_y
+    text_y = start_y + 6
+    # The text window stops two rows short of the bottom, above the hint
+    text_h = h - 2 - text_y
 
-    # Title
-    title = " TYPERACER "
-    stdscr.addstr(y, max(0, center_x - len(title) // 2), title,
-                  curses.color_pair(PAIR_TITLE) | curses.A_BOLD)
-    y += 1
+    # Background strip for each visible text line so spaces are visible.
+    # Include +1 width for the wrap-boundary space on all lines except the last
+    bg_spans: List[Tuple[int, str]] = []
+    for line_num, line in enumerate(lines):
+        row = line_num * 2
+        if row >= text_h:
+            break
+        bg_width = len(line) + (1 if line_num < len(lines) - 1 else 0)
+        bg_spans.append((row, _spaces(bg_width)))
 
-    # Separator
-    stdscr.addstr(y, text_x, HORIZONTAL * text_area_width,
-                  curses.color_pair(PAIR_DIM) | curses.A_DIM)
-    y += 1
+    game._layout = _GameLayout(
+        h=h, w=w, center_x=w // 2, start_y=start_y,
+        text_area_width=text_area_width, text_x=text_x,
+        stats_y=start_y + 2, text_y=text_y, text_h=text_h,
+        lines=lines, char_rows=char_rows, char_cols=char_cols,
+        bg_spans=bg_spans,
+    )
+    return game._layout
 
-    # Stats bar (centered)
-    if game.is_started:
-        wpm_str = f"WPM: {game.wpm:5.1f}"
-        acc_str = f"ACC: {game.accuracy:5.1f}%"
-        time_str = f"TIME: {game.elapsed_seconds:5.1f}s"
-    else:
-        wpm_str = "WPM:   ---"
-        acc_str = "ACC:   ---"
-        time_str = "TIME:   0.0s"
 
-    stats_line = f"  {wpm_str}  │  {acc_str}  │  {time_str}  "
-    stdscr.addstr(y, max(0, center_x - len(stats_line) // 2), stats_line,
-                  curses.color_pair(PAIR_STATS) | curses.A_BOLD)
-    y += 1
+def _draw_game_full(stdscr, game: GameState, layout: _GameLayout):
+    """Paint the whole game screen and create its windows."""
+    stdscr.erase()
+    text_x, text_h, lines = layout.text_x, layout.text_h, layout.lines
+
+    # Title
+    title = " TYPERACER "
+    _addstr_clipped(stdscr, layout.start_y,
+                    max(0, layout.center_x - len(title) // 2),
+                    title, ATTR_TITLE)
+
+    # Separators around the stats and progress bar
+    _addstr_clipped(stdscr, layout.start_y + 1, text_x,
+                    _hbar(layout.text_area_width), ATTR_DIM_BORDER)
+    _addstr_clipped(stdscr, layout.start_y + 4, text_x,
+                    _hbar(layout.text_area_width), ATTR_DIM_BORDER)
+
+    stats_win = curses.newwin(2, layout.w, layout.stats_y, 0)
+    text_win = (curses.newwin(text_h, layout.w, layout.text_y, 0)
+                if text_h > 0 else None)
+    hint_win = curses.newwin(1, layout.w, layout.h - 1, 0)
+    game._subwins = (stats_win, text_win, hint_win)
+    for win in game._subwins:
+        if win is not None:
+            win.leaveok(True)
+
+    if text_win is not None:
+        # Background strips go down once; later frames only repaint
+        # characters, whose attributes carry the same background
+        for row, blanks in layout.bg_spans:
+            _addstr_clipped(text_win, row, text_x, blanks, ATTR_TEXT_BG)
+
+        # Render characters on top of the background
+        _draw_chars(text_win, game, 0, len(game.target),
+                    text_x, layout.char_rows, layout.char_cols, text_h)
+
+        # Author attribution below the text
+        if game.author:
+            author_str = f"— {game.author}"
+            author_y = len(lines) * 2
+            if author_y < text_h:
+                author_x = text_x + layout.text_area_width - len(author_str)
+                _addstr_clipped(text_win, author_y, max(text_x, author_x),
+                                author_str, ATTR_AUTHOR)
 
-    # Progress bar (same width as text area)
-    bar_width = text_area_width
+    # Hint at bottom
+    hint = " ESC to quit │ Backspace to correct "
+    _addstr_clipped(hint_win, 0, max(0, layout.center_x - len(hint) // 2),
+                    hint, ATTR_DIM_BORDER)
+
+    stdscr.noutrefresh()
+    hint_win.noutrefresh()
+    if text_win is not None:
+        text_win.noutrefresh()
+
+
+def _draw_game_delta(game: GameState, layout: _GameLayout):
+    """Repaint the text cells touched since the previous draw."""
+    text_win = game._subwins[1]
+    typed_len = len(game.typed)
+    prev_len = game._last_drawn_typed_len
+    if text_win is None or (typed_len == prev_len
+                            and game._dirty_from >= typed_len):
+        return
+
+    # Repaint every cell touched since the last draw, up to and
+    # including the old and new cursor positions
+    first = min(game._dirty_from, prev_len, typed_len)
+    _draw_chars(text_win, game, first, max(prev_len, typed_len) + 1,
+                layout.text_x, layout.char_rows, layout.char_cols,
+                layout.text_h)
+    text_win.noutrefresh()
+
+
+def _draw_stats(game: GameState, layout: _GameLayout, full_redraw: bool):
+    """Update the stats line and progress bar if they changed."""
+    stats_win = game._subwins[0]
+    now = time.monotonic()
+
+    # WPM and time barely move between keystrokes, so the stats line is
+    # rebuilt at most every STATS_MIN_INTERVAL, plus once at the finish
+    stats_changed = False
+    # A skipped rebuild stays pending until stats_due_in() says it is due
+    game._stats_pending = not (
+        full_redraw or game.is_finished
+        or now - game._last_stats_time >= STATS_MIN_INTERVAL
+    )
+    if not game._stats_pending:
+        game._last_stats_time = now
+        stats = game.snapshot(now)
+
+        # Stats bar (centered)
+        if game.is_started:
+            wpm_str = f"WPM: {stats.wpm:5.1f}"
+            acc_str = f"ACC: {stats.accuracy:5.1f}%"
+            time_str = f"TIME: {stats.elapsed:5.1f}s"
+        else:
+            wpm_str = "WPM:   ---"
+            acc_str = "ACC:   ---"
+            time_str = "TIME:   0.0s"
+
+        stats_line = f"  {wpm_str}  │  {acc_str}  │  {time_str}  "
+        stats_changed = full_redraw or stats_line != game._last_stats
+        if stats_changed:
+            if len(stats_line) != len(game._last_stats):
+                # A line of a different length is centered differently and
+                # would leave a stray cell from the old one
+                stats_win.move(0, 0)
+                stats_win.clrtoeol()
+            _addstr_clipped(stats_win, 0,
+                            max(0, layout.center_x - len(stats_line) // 2),
+                            stats_line, ATTR_STATS)
+            game._last_stats = stats_line
+
+    # Progress bar (same width as text area). After the first draw only
+    # the cells between the old and new fill level are rewritten.
+    bar_width = layout.text_area_width
     filled = int(bar_width * game.progress / 100)
-    bar = "█" * filled + "░" * (bar_width - filled)
-    stdscr.addstr(y, text_x, bar, curses.color_pair(PAIR_TITLE))
-    y += 1
+    bar_changed = full_redraw or filled != game._last_filled
+    if full_redraw:
+        _addstr_clipped(stats_win, 1, layout.text_x,
+                        _progress_bar(filled, bar_width), ATTR_BAR)
+    elif bar_changed:
+        lo, hi = sorted((game._last_filled, filled))
+        segment = (_BAR_FULL if filled > lo else _BAR_EMPTY)[:hi - lo]
+        _addstr_clipped(stats_win, 1, layout.text_x + lo, segment, ATTR_BAR)
+    game._last_filled = filled
 
-    # Separator
-    stdscr.addstr(y, text_x, HORIZONTAL * text_area_width,
-                  curses.color_pair(PAIR_DIM) | curses.A_DIM)
-    y += 2
+    if stats_changed or bar_changed:
+        stats_win.noutrefresh()
 
-    # Text area
-    text_y = y
 
-    # Build a flat index map: for each char position in target,
-    # figure out which (row, col) it maps to on screen.
-    # Word-wrapping drops the space at line breaks, so we add it back
-    # at the end of each wrapped line to keep positions aligned with target.
-    char_positions: List[Tuple[int, int]] = []
-    for line_num, line in enumerate(lines):
-        for col_num in range(len(line)):
-            char_positions.append((text_y + line_num * 2, text_x + col_num))
-        # Add the missing space at the wrap boundary (except after the last line)
-        if line_num < len(lines) - 1:
-            char_positions.append((text_y + line_num * 2, text_x + len(line)))
+def stats_due_in(game: GameState) -> Optional[float]:
+    """Seconds until a deferred stats line update is due, or None.
 
-    # Paint background strips for each text line so spaces are visible
-    # Include +1 width for the wrap-boundary space on all lines except the last
-    bg_attr = curses.color_pair(PAIR_TEXT_BG)
-    painted_rows = set()
-    for line_num, line in enumerate(lines):
-        row = text_y + line_num * 2
-        if row >= h - 2:
-            break
-        if row not in painted_rows:
-            bg_width = len(line) + (1 if line_num < len(lines) - 1 else 0)
-            try:
-                stdscr.addstr(row, text_x, " " * bg_width, bg_attr)
-            except curses.error:
-                pass
-            painted_rows.add(row)
-
-    # Render characters on top of the background
-    for i, char in enumerate(game.target):
-        if i >= len(char_positions):
-            break
-        row, col = char_positions[i]
-        if row >= h - 2:
-            break
+    The game loop must redraw by then, or the stats line keeps showing
+    numbers from before the last keystrokes.
+    """
+    if not game._stats_pending:
+        return None
+    due = game._last_stats_time + STATS_MIN_INTERVAL
+    return max(0.0, due - time.monotonic())
 
-        if i < len(game.typed):
-            if game.typed[i] == char:
-                attr = curses.color_pair(PAIR_CORRECT) | curses.A_BOLD
-            else:
-                attr = curses.color_pair(PAIR_INCORRECT) | curses.A_BOLD
-        elif i == len(game.typed):
-            # Cursor position
-            attr = curses.color_pair(PAIR_CURSOR)
-        else:
-            attr = curses.color_pair(PAIR_UNTYPED) | curses.A_DIM
-
-        try:
-            stdscr.addstr(row, col, char, attr)
-        except curses.error:
-            pass
-
-    # Author attribution below the text
-    if game.author:
-        last_text_row = text_y + (len(lines) - 1) * 2
-        author_str = f"— {game.author}"
-        author_y = last_text_row + 2
-        if author_y < h - 2:
-            try:
-                author_x = text_x + text_area_width - len(author_str)
-                stdscr.addstr(author_y, max(text_x, author_x), author_str,
-                              curses.color_pair(PAIR_DIM) | curses.A_ITALIC)
-            except curses.error:
-                pass
 
-    # Hint at bottom
-    hint = " ESC to quit │ Backspace to correct "
-    try:
-        stdscr.addstr(h - 1, max(0, center_x - len(hint) // 2), hint,
-                      curses.color_pair(PAIR_DIM) | curses.A_DIM)
-    except curses.error:
-        pass
+def draw_game(stdscr, game: GameState):
+    """Draw the main game screen, centered like the other screens.
+
+    The first draw of a race (or the first after a resize) paints the whole
+    screen and splits it into stats, text and hint windows. Later draws
+    only repaint what changed since the previous one, in the window that
+    holds it: the characters around the cursor, the progress bar and the
+    stats line.
+    """
+    layout = _game_layout(stdscr, game)
+    full_redraw = game._subwins is None
+
+    if full_redraw:
+        _draw_game_full(stdscr, game, layout)
+    else:
+        _draw_game_delta(game, layout)
+    _draw_stats(game, layout, full_redraw)
 
-    stdscr.refresh()
+    game._last_drawn_typed_len = len(game.typed)
+    game._dirty_from = len(game.typed)
 
+    curses.doupdate()
 
-def draw_error(stdscr, error_message: str):
-    """Draw a network error screen, centered like the other screens."""
-    stdscr.clear()
-    h, w = stdscr.getmaxyx()
-    center_x = w // 2
 
+@lru_cache(maxsize=32)
+def _error_plan(h: int, w: int, error_message: str) -> _Plan:
+    """Lay out the network error screen."""
+    center_x = w // 2
+    plan = []
     y = max(2, h // 2 - 5)
 
     # Error icon and header
     header = "NETWORK ERROR"
-    stdscr.addstr(y, max(0, center_x - len(header) // 2), header,
-                  curses.color_pair(PAIR_INCORRECT) | curses.A_BOLD)
+    plan.append((y, max(0, center_x - len(header) // 2), header,
+                 ATTR_INCORRECT))
     y += 2
 
-    stdscr.addstr(y, max(0, center_x - 20), HORIZONTAL * 40,
-                  curses.color_pair(PAIR_DIM) | curses.A_DIM)
+    plan.append((y, max(0, center_x - 20), _hbar(40), ATTR_DIM_BORDER))
     y += 2
 
     # Error message
     msg = "Unable to fetch quote from the server."
-    stdscr.addstr(y, max(0, center_x - len(msg) // 2), msg,
-                  curses.color_pair(PAIR_DIM))
+    plan.append((y, max(0, center_x - len(msg) // 2), msg, ATTR_DIM))
     y += 2
 
     # Detail
     detail = error_message if len(error_message) < w - 4 else error_message[:w - 7] + "..."
-    stdscr.addstr(y, max(0, center_x - len(detail) // 2), detail,
-                  curses.color_pair(PAIR_DIM) | curses.A_DIM)
+    plan.append((y, max(0, center_x - len(detail) // 2), detail,
+                 ATTR_DIM_BORDER))
     y += 2
 
-    stdscr.addstr(y, max(0, center_x - 20), HORIZONTAL * 40,
-                  curses.color_pair(PAIR_DIM) | curses.A_DIM)
+    plan.append((y, max(0, center_x - 20), _hbar(40), ATTR_DIM_BORDER))
     y += 2
 
     # Options
     options = "Press any key to retry  │  ESC to quit"
-    stdscr.addstr(y, max(0, center_x - len(options) // 2), options,
-                  curses.color_pair(PAIR_HIGHLIGHT) | curses.A_BOLD)
-
-    stdscr.refresh()
+    plan.append((y, max(0, center_x - len(options) // 2), options,
+                 ATTR_HIGHLIGHT))
+    return tuple(plan)
 
 
-def draw_results(stdscr, game: GameState):
-    """Draw the results screen after a race."""
+def draw_error(stdscr, error_message: str):
+    """Draw a network error screen, centered like the other screens."""
     stdscr.clear()
     h, w = stdscr.getmaxyx()
+    for y, x, text, attr in _error_plan(h, w, error_message):
+        stdscr.addstr(y, x, text, attr)
 
+    stdscr.noutrefresh()
+    curses.doupdate()
+
+
+@lru_cache(maxsize=32)
+def _results_plan(h: int, w: int, author: str,
+                  stat_rows: Tuple[Tuple[str, str], ...], wpm: int) -> _Plan:
+    """Lay out the results screen for already formatted stats."""
     center_x = w // 2
+    plan = []
     y = max(2, h // 2 - 8)
 
     # Header
     header = "🏁  RACE COMPLETE!  🏁"
-    stdscr.addstr(y, max(0, center_x - len(header) // 2), header,
-                  curses.color_pair(PAIR_TITLE) | curses.A_BOLD)
+    plan.append((y, max(0, center_x - len(header) // 2), header, ATTR_TITLE))
     y += 2
 
-    stdscr.addstr(y, max(0, center_x - 20), HORIZONTAL * 40,
-                  curses.color_pair(PAIR_DIM) | curses.A_DIM)
+    plan.append((y, max(0, center_x - 20), _hbar(40), ATTR_DIM_BORDER))
     y += 2
 
     # Quote attribution
-    if game.author:
-        author_str = f"Quote by {game.author}"
-        stdscr.addstr(y, max(0, center_x - len(author_str) // 2), author_str,
-                      curses.color_pair(PAIR_DIM) | curses.A_ITALIC)
+    if author:
+        author_str = f"Quote by {author}"
+        plan.append((y, max(0, center_x - len(author_str) // 2), author_str,
+                     ATTR_AUTHOR))
         y += 2
 
     # Stats
-    stats = [
-        ("WPM", f"{game.wpm:.1f}"),
-        ("Raw WPM", f"{game.raw_wpm:.1f}"),
-        ("Accuracy", f"{game.accuracy:.1f}%"),
-        ("Time", f"{game.elapsed_seconds:.1f}s"),
-        ("Characters", f"{game.correct_chars}/{len(game.target)}"),
-        ("Keystrokes", f"{game.total_keystrokes}"),
-    ]
-
-    for label, value in stats:
+    for label, value in stat_rows:
         label_str = f"  {label:>12s}  │  "
-        stdscr.addstr(y, max(0, center_x - 16), label_str,
-                      curses.color_pair(PAIR_DIM))
-        stdscr.addstr(y, max(0, center_x - 16) + len(label_str), value,
-                      curses.color_pair(PAIR_STATS) | curses.A_BOLD)
+        plan.append((y, max(0, center_x - 16), label_str, ATTR_DIM))
+        plan.append((y, max(0, center_x - 16) + len(label_str), value,
+                     ATTR_STATS))
         y += 1
 
     y += 1
-    stdscr.addstr(y, max(0, center_x - 20), HORIZONTAL * 40,
-                  curses.color_pair(PAIR_DIM) | curses.A_DIM)
+    plan.append((y, max(0, center_x - 20), _hbar(40), ATTR_DIM_BORDER))
     y += 2
 
     # WPM rating
-    wpm = game.wpm
     if wpm >= 100:
         rating = "⚡ LEGENDARY"
-        pair = PAIR_HIGHLIGHT
+        attr = ATTR_HIGHLIGHT
     elif wpm >= 80:
         rating = "🔥 BLAZING FAST"
-        pair = PAIR_TITLE
+        attr = ATTR_TITLE
     elif wpm >= 60:
         rating = "✨ IMPRESSIVE"
-        pair = PAIR_STATS
+        attr = ATTR_STATS
     elif wpm >= 40:
         rating = "👍 SOLID"
-        pair = PAIR_CORRECT
+        attr = ATTR_CORRECT
     elif wpm >= 25:
         rating = "📝 KEEP PRACTICING"
-        pair = PAIR_UNTYPED
+        attr = ATTR_UNTYPED_BOLD
     else:
         rating = "🐢 WARMING UP"
-        pair = PAIR_DIM
+        attr = ATTR_DIM_BOLD
 
-    stdscr.addstr(y, max(0, center_x - len(rating) // 2), rating,
-                  curses.color_pair(pair) | curses.A_BOLD)
+    plan.append((y, max(0, center_x - len(rating) // 2), rating, attr))
     y += 3
 
     # Options
     options = "Press any key to race again  │  ESC to quit"
-    stdscr.addstr(y, max(0, center_x - len(options) // 2), options,
-                  curses.color_pair(PAIR_HIGHLIGHT) | curses.A_BOLD)
+    plan.append((y, max(0, center_x - len(options) // 2), options,
+                 ATTR_HIGHLIGHT))
+    return tuple(plan)
+
 
-    stdscr.refresh()
+def draw_results(stdscr, game: GameState):
+    """Draw the results screen after a race."""
+    stdscr.clear()
+    h, w = stdscr.getmaxyx()
+    stats = game.snapshot(time.monotonic())
+
+    stat_rows = (
+        ("WPM", f"{stats.wpm:.1f}"),
+        ("Raw WPM", f"{stats.raw_wpm:.1f}"),
+        ("Accuracy", f"{stats.accuracy:.1f}%"),
+        ("Time", f"{stats.elapsed:.1f}s"),
+        ("Characters", f"{stats.correct_chars}/{len(game.target)}"),
+        ("Keystrokes", f"{game.total_keystrokes}"),
+    )
+    # The rating thresholds are whole numbers, so the integer part of
+    # the WPM picks the same rating and makes a better cache key
+    plan = _results_plan(h, w, game.author, stat_rows, int(stats.wpm))
+    for y, x, text, attr in plan:
+        stdscr.addstr(y, x, text, attr)
+
+    stdscr.noutrefresh()
+    curses.doupdate()
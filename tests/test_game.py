@@ -1,9 +1,11 @@
 """Tests for the game module."""
 
+import operator
+import random
 import unittest
 from unittest.mock import patch
-from typeracer.game import GameState
-from typeracer.quotes import Quote, QuoteFetchError
+from typeracer.game import GameState, _QuotePrefetcher
+from typeracer.quotes import QUOTES, Quote, QuoteFetchError
 
 # Patch where fetch_quote is looked up (in the game module), not where it's defined
 FETCH_PATCH = "typeracer.game.fetch_quote"
@@ -23,7 +25,7 @@ class TestGameState(unittest.TestCase):
         game = GameState()
         self.assertEqual(game.target, "Hello world.")
         self.assertEqual(game.author, "Test Author")
-        self.assertEqual(game.typed, [])
+        self.assertEqual(game.typed, b"")
         self.assertFalse(game.is_started)
         self.assertFalse(game.is_finished)
         self.assertEqual(game.wpm, 0.0)
@@ -65,6 +67,16 @@ class TestGameState(unittest.TestCase):
         game.type_char("!")
         self.assertEqual(len(game.typed), 2)
 
+    @patch(FETCH_PATCH, return_value=make_quote("Hi"))
+    def test_type_char_byte(self, _mock):
+        """Characters can be typed by ASCII code."""
+        game = GameState()
+        game.type_char_byte(ord("H"))
+        game.type_char_byte(ord("x"))
+        self.assertEqual(game.typed, b"Hx")
+        self.assertEqual(game.correct_chars, 1)
+        self.assertTrue(game.is_finished)
+
     @patch(FETCH_PATCH, return_value=make_quote("abc"))
     def test_backspace(self, _mock):
         """Backspace removes the last typed character."""
@@ -74,14 +86,24 @@ class TestGameState(unittest.TestCase):
         self.assertEqual(len(game.typed), 2)
         game.backspace()
         self.assertEqual(len(game.typed), 1)
-        self.assertEqual(game.typed, ["a"])
+        self.assertEqual(game.typed, b"a")
 
     @patch(FETCH_PATCH, return_value=make_quote("abc"))
     def test_backspace_on_empty(self, _mock):
         """Backspace on empty typed list does nothing."""
         game = GameState()
         game.backspace()  # should not raise
-        self.assertEqual(game.typed, [])
+        self.assertEqual(game.typed, b"")
+
+    @patch(FETCH_PATCH, return_value=make_quote("ab"))
+    def test_backspace_ignored_after_finish(self, _mock):
+        """A finished race cannot be reopened by deleting characters."""
+        game = GameState()
+        game.type_char("a")
+        game.type_char("b")
+        game.backspace()
+        self.assertEqual(game.typed, b"ab")
+        self.assertTrue(game.is_finished)
 
     @patch(FETCH_PATCH, return_value=make_quote("abcd"))
     def test_progress(self, _mock):
@@ -101,6 +123,64 @@ class TestGameState(unittest.TestCase):
         game.type_char("x")  # wrong
         self.assertEqual(game.correct_chars, 1)
 
+    @patch(FETCH_PATCH, return_value=make_quote("abc"))
+    def test_correct_chars_after_backspace(self, _mock):
+        """correct_chars stays in sync when characters are deleted."""
+        game = GameState()
+        game.type_char("a")  # correct
+        game.type_char("x")  # wrong
+        game.backspace()
+        self.assertEqual(game.correct_chars, 1)
+        game.backspace()
+        self.assertEqual(game.correct_chars, 0)
+        game.type_char("a")
+        game.type_char("b")
+        self.assertEqual(game.correct_chars, 2)
+
+    @patch(FETCH_PATCH, return_value=make_quote("the quick brown fox"))
+    def test_correct_chars_matches_full_scan(self, _mock):
+        """The running count agrees with a full rescan after mixed edits."""
+        game = GameState()
+        rng = random.Random(1234)
+        for _ in range(200):
+            if game.is_finished:
+                # A finished race cannot be edited, so start another
+                game.reset()
+            elif rng.random() < 0.3:
+                game.backspace()
+            else:
+                i = len(game.typed)
+                game.type_char(game.target[i] if rng.random() < 0.7 else "#")
+            expected = sum(map(operator.eq, game.typed,
+                               game.target.encode("ascii")))
+            self.assertEqual(game.correct_chars, expected)
+            self.assertEqual(game.correct_prefix_len,
+                             min(game.mismatch_positions,
+                                 default=len(game.typed)))
+
+    @patch(FETCH_PATCH, return_value=make_quote("abcdef"))
+    def test_mismatch_tracking(self, _mock):
+        """Wrong characters are tracked by index alongside the correct prefix."""
+        game = GameState()
+        for char in "abxdy":
+            game.type_char(char)
+        self.assertEqual(game.mismatch_positions, {2, 4})
+        self.assertEqual(game.correct_prefix_len, 2)
+        game.backspace()
+        game.backspace()
+        game.backspace()
+        self.assertEqual(game.mismatch_positions, set())
+        self.assertEqual(game.correct_prefix_len, 2)
+
+    @patch(FETCH_PATCH, return_value=make_quote("it’s"))
+    def test_non_ascii_target_char_never_matches(self, _mock):
+        """A non-ASCII target character counts as wrong whatever is typed."""
+        game = GameState()
+        for char in "it's":
+            game.type_char(char)
+        self.assertTrue(game.is_finished)
+        self.assertEqual(game.correct_chars, 3)
+
     @patch(FETCH_PATCH, return_value=make_quote("ab"))
     def test_accuracy(self, _mock):
         """Accuracy reflects correct keystrokes vs total keystrokes."""
@@ -110,6 +190,31 @@ class TestGameState(unittest.TestCase):
         # 1 correct out of 2 keystrokes = 50%
         self.assertAlmostEqual(game.accuracy, 50.0)
 
+    @patch(FETCH_PATCH, return_value=make_quote("abcdefghij"))
+    def test_snapshot(self, _mock):
+        """snapshot() computes every stat from the same clock reading."""
+        game = GameState()
+        for char in "abcdx":
+            game.type_char(char)
+        now = game.start_time + 6.0  # 0.1 minutes
+
+        stats = game.snapshot(now)
+        self.assertAlmostEqual(stats.elapsed, 6.0)
+        self.assertAlmostEqual(stats.wpm, (4 / 5.0) / 0.1)
+        self.assertAlmostEqual(stats.raw_wpm, (5 / 5.0) / 0.1)
+        self.assertAlmostEqual(stats.accuracy, 80.0)
+        self.assertAlmostEqual(stats.progress, 50.0)
+        self.assertEqual(stats.correct_chars, 4)
+
+    @patch(FETCH_PATCH, return_value=make_quote("abc"))
+    def test_snapshot_before_start(self, _mock):
+        """A race that has not started reports zero time and speed."""
+        game = GameState()
+        stats = game.snapshot(12345.0)
+        self.assertEqual(stats.elapsed, 0.0)
+        self.assertEqual(stats.wpm, 0.0)
+        self.assertEqual(stats.accuracy, 100.0)
+
     @patch(FETCH_PATCH)
     def test_reset(self, mock_fetch):
         """Reset clears state and fetches a new quote."""
@@ -123,7 +228,7 @@ class TestGameState(unittest.TestCase):
 
         self.assertEqual(game.target, "new quote")
         self.assertEqual(game.author, "Author B")
-        self.assertEqual(game.typed, [])
+        self.assertEqual(game.typed, b"")
         self.assertFalse(game.is_started)
         self.assertEqual(game.total_keystrokes, 0)
 
@@ -150,5 +255,38 @@ class TestGameStateNetworkError(unittest.TestCase):
             game.reset()
 
 
+class TestQuotePrefetcher(unittest.TestCase):
+    """Tests for background quote prefetching."""
+
+    def setUp(self):
+        self.prefetcher = _QuotePrefetcher()
+        patcher = patch("typeracer.game._prefetcher", self.prefetcher)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def wait_for_worker(self):
+        """Let the background fetch finish before the mock is removed."""
+        self.prefetcher._thread.join()
+
+    @patch(FETCH_PATCH, return_value=make_quote("Prefetched.", "Someone"))
+    def test_reset_uses_prefetched_quote(self, mock_fetch):
+        """GameState takes its quote from the prefetcher once started."""
+        self.prefetcher.start()
+        game = GameState()
+        self.wait_for_worker()
+        self.assertEqual(game.target, "Prefetched.")
+        self.assertEqual(game.author, "Someone")
+        # One quote for this game and one fetched ahead for the next
+        self.assertEqual(mock_fetch.call_count, 2)
+
+    @patch(FETCH_PATCH, side_effect=QuoteFetchError("Network error: down"))
+    def test_prefetch_error_uses_offline_quote(self, _mock):
+        """A failed background fetch falls back to a bundled quote."""
+        self.prefetcher.start()
+        game = GameState()
+        self.wait_for_worker()
+        self.assertIn(Quote(game.target, game.author), QUOTES)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,53 @@
+"""Tests for the main module."""
+
+import unittest
+from unittest.mock import MagicMock, patch
+from typeracer.game import GameState
+from typeracer.main import game_loop, next_tick_timeout
+from typeracer.quotes import Quote
+
+
+class TestNextTickTimeout(unittest.TestCase):
+    """Tests for next_tick_timeout()."""
+
+    @patch("typeracer.game.fetch_quote", return_value=Quote("ab", "Someone"))
+    def test_waits_for_deferred_stats(self, _mock):
+        """A deferred stats update cuts the wait to when it is due."""
+        game = GameState()
+        game.type_char("a")
+        self.assertGreater(next_tick_timeout(game), 100)
+
+        with patch("typeracer.main.stats_due_in", return_value=0.05):
+            self.assertEqual(next_tick_timeout(game), 50)
+
+
+class TestGameLoop(unittest.TestCase):
+    """Tests for game_loop() driven by scripted key presses."""
+
+    @patch("typeracer.main.draw_results")
+    @patch("typeracer.main.draw_game")
+    @patch("typeracer.main.draw_welcome")
+    @patch("typeracer.main.init_colors")
+    @patch("typeracer.main.start_prefetch")
+    @patch("typeracer.main.curses.curs_set")
+    @patch("typeracer.game.fetch_quote", return_value=Quote("ab", "Someone"))
+    def test_keys_after_finish_are_not_applied(self, _fetch, _curs_set,
+                                               _prefetch, _colors, _welcome,
+                                               _draw_game, mock_results):
+        """A backspace queued behind the finishing key cannot undo it."""
+        stdscr = MagicMock()
+        # Welcome key, then a burst that finishes the race with a backspace
+        # queued behind it. That backspace answers the results screen and
+        # starts a second race, which ESC quits.
+        stdscr.getch.side_effect = [ord("x"), ord("a"), ord("b"), 127, 27]
+
+        game_loop(stdscr)
+
+        mock_results.assert_called_once()
+        game = mock_results.call_args[0][1]
+        self.assertEqual(game.typed, b"ab")
+        self.assertTrue(game.is_finished)
+
+
+if __name__ == "__main__":
+    unittest.main()
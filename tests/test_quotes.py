@@ -1,120 +1,237 @@
 """Tests for the quotes module."""
 
 import json
+import socket
+import ssl
 import unittest
 from unittest.mock import patch, MagicMock
-from typeracer.quotes import fetch_quote, Quote, QuoteFetchError
+from typeracer import quotes
+from typeracer.quotes import (
+    fetch_quote, offline_quote, Quote, QuoteFetchError, QUOTES,
+)
+
+CONN_PATCH = "typeracer.quotes.http.client.HTTPSConnection"
+
+
+def make_response(body, status=200):
+    """Helper to create a mock HTTP response returning the given body."""
+    mock_resp = MagicMock()
+    mock_resp.status = status
+    mock_resp.will_close = False
+    mock_resp.read.return_value = body
+    return mock_resp
+
+
+def mock_connection(mock_conn_cls, body=None, status=200):
+    """Make HTTPSConnection return a connection that answers with body."""
+    mock_conn = MagicMock()
+    mock_conn.getresponse.return_value = make_response(body, status)
+    mock_conn_cls.return_value = mock_conn
+    return mock_conn
 
 
 class TestFetchQuote(unittest.TestCase):
     """Tests for fetch_quote()."""
 
-    @patch("typeracer.quotes.urllib.request.urlopen")
-    def test_returns_quote_with_author(self, mock_urlopen):
+    def setUp(self):
+        # Every test starts without a kept-alive connection
+        quotes._conn = None
+        self.addCleanup(setattr, quotes, "_conn", None)
+
+    @patch(CONN_PATCH)
+    def test_returns_quote_with_author(self, mock_conn_cls):
         """fetch_quote returns a Quote with content and author from the API."""
         body = json.dumps({
             "content": "To be or not to be.",
             "author": "Shakespeare",
         }).encode("utf-8")
-        mock_resp = MagicMock()
-        mock_resp.read.return_value = body
-        mock_resp.__enter__ = lambda s: s
-        mock_resp.__exit__ = MagicMock(return_value=False)
-        mock_urlopen.return_value = mock_resp
+        mock_connection(mock_conn_cls, body)
 
         result = fetch_quote()
         self.assertIsInstance(result, Quote)
         self.assertEqual(result.content, "To be or not to be.")
         self.assertEqual(result.author, "Shakespeare")
 
-    @patch("typeracer.quotes.urllib.request.urlopen")
-    def test_missing_author_defaults_to_unknown(self, mock_urlopen):
+    @patch(CONN_PATCH)
+    def test_missing_author_defaults_to_unknown(self, mock_conn_cls):
         """fetch_quote sets author to 'Unknown' when API omits it."""
         body = json.dumps({"content": "Some wise words."}).encode("utf-8")
-        mock_resp = MagicMock()
-        mock_resp.read.return_value = body
-        mock_resp.__enter__ = lambda s: s
-        mock_resp.__exit__ = MagicMock(return_value=False)
-        mock_urlopen.return_value = mock_resp
+        mock_connection(mock_conn_cls, body)
 
         result = fetch_quote()
         self.assertEqual(result.content, "Some wise words.")
         self.assertEqual(result.author, "Unknown")
 
-    @patch("typeracer.quotes.urllib.request.urlopen")
-    def test_empty_author_defaults_to_unknown(self, mock_urlopen):
+    @patch(CONN_PATCH)
+    def test_empty_author_defaults_to_unknown(self, mock_conn_cls):
         """fetch_quote sets author to 'Unknown' when author is empty string."""
         body = json.dumps({"content": "A quote.", "author": ""}).encode("utf-8")
-        mock_resp = MagicMock()
-        mock_resp.read.return_value = body
-        mock_resp.__enter__ = lambda s: s
-        mock_resp.__exit__ = MagicMock(return_value=False)
-        mock_urlopen.return_value = mock_resp
+        mock_connection(mock_conn_cls, body)
 
         result = fetch_quote()
         self.assertEqual(result.author, "Unknown")
 
-    @patch("typeracer.quotes.urllib.request.urlopen")
-    def test_raises_on_empty_content(self, mock_urlopen):
+    @patch(CONN_PATCH)
+    def test_raises_on_empty_content(self, mock_conn_cls):
         """fetch_quote raises QuoteFetchError when API returns empty content."""
         body = json.dumps({"content": ""}).encode("utf-8")
-        mock_resp = MagicMock()
-        mock_resp.read.return_value = body
-        mock_resp.__enter__ = lambda s: s
-        mock_resp.__exit__ = MagicMock(return_value=False)
-        mock_urlopen.return_value = mock_resp
+        mock_connection(mock_conn_cls, body)
 
         with self.assertRaises(QuoteFetchError) as ctx:
             fetch_quote()
         self.assertIn("empty", str(ctx.exception).lower())
 
-    @patch("typeracer.quotes.urllib.request.urlopen")
-    def test_raises_on_network_error(self, mock_urlopen):
+    @patch(CONN_PATCH)
+    def test_raises_on_network_error(self, mock_conn_cls):
         """fetch_quote raises QuoteFetchError on network failure."""
-        import urllib.error
-        mock_urlopen.side_effect = urllib.error.URLError("Connection refused")
+        mock_conn = mock_connection(mock_conn_cls)
+        mock_conn.request.side_effect = ConnectionRefusedError("Connection refused")
 
         with self.assertRaises(QuoteFetchError) as ctx:
             fetch_quote()
         self.assertIn("Network error", str(ctx.exception))
 
-    @patch("typeracer.quotes.urllib.request.urlopen")
-    def test_raises_on_timeout(self, mock_urlopen):
+    @patch(CONN_PATCH)
+    def test_raises_on_http_error_status(self, mock_conn_cls):
+        """fetch_quote raises QuoteFetchError when the API answers non-200."""
+        mock_connection(mock_conn_cls, b"", status=503)
+
+        with self.assertRaises(QuoteFetchError) as ctx:
+            fetch_quote()
+        self.assertIn("HTTP 503", str(ctx.exception))
+
+    @patch(CONN_PATCH)
+    def test_raises_on_timeout(self, mock_conn_cls):
         """fetch_quote raises QuoteFetchError on socket timeout."""
-        import socket
-        mock_urlopen.side_effect = socket.timeout("timed out")
+        mock_conn = mock_connection(mock_conn_cls)
+        mock_conn.request.side_effect = socket.timeout("timed out")
 
         with self.assertRaises(QuoteFetchError) as ctx:
             fetch_quote()
         self.assertIn("Connection failed", str(ctx.exception))
 
-    @patch("typeracer.quotes.urllib.request.urlopen")
-    def test_raises_on_invalid_json(self, mock_urlopen):
+    @patch(CONN_PATCH)
+    def test_raises_on_invalid_json(self, mock_conn_cls):
         """fetch_quote raises QuoteFetchError when API returns invalid JSON."""
-        mock_resp = MagicMock()
-        mock_resp.read.return_value = b"not json at all"
-        mock_resp.__enter__ = lambda s: s
-        mock_resp.__exit__ = MagicMock(return_value=False)
-        mock_urlopen.return_value = mock_resp
+        mock_connection(mock_conn_cls, b"not json at all")
 
         with self.assertRaises(QuoteFetchError) as ctx:
             fetch_quote()
         self.assertIn("Invalid API response", str(ctx.exception))
 
-    @patch("typeracer.quotes.urllib.request.urlopen")
-    def test_raises_on_missing_content_key(self, mock_urlopen):
+    @patch(CONN_PATCH)
+    def test_raises_on_missing_content_key(self, mock_conn_cls):
         """fetch_quote raises QuoteFetchError when JSON has no content field."""
         body = json.dumps({"text": "no content key"}).encode("utf-8")
-        mock_resp = MagicMock()
-        mock_resp.read.return_value = body
-        mock_resp.__enter__ = lambda s: s
-        mock_resp.__exit__ = MagicMock(return_value=False)
-        mock_urlopen.return_value = mock_resp
+        mock_connection(mock_conn_cls, body)
 
         with self.assertRaises(QuoteFetchError) as ctx:
             fetch_quote()
         self.assertIn("empty", str(ctx.exception).lower())
 
+    @patch(CONN_PATCH)
+    def test_unescapes_json_strings(self, mock_conn_cls):
+        """Escaped characters in the API fields are decoded."""
+        body = json.dumps({
+            "content": 'He said "hi" \u2014 twice.',
+            "author": "Anon\\ymous",
+        }).encode("utf-8")
+        mock_connection(mock_conn_cls, body)
+
+        result = fetch_quote()
+        self.assertEqual(result.content, 'He said "hi" \u2014 twice.')
+        self.assertEqual(result.author, "Anon\\ymous")
+
+    @patch(CONN_PATCH)
+    def test_parses_extra_fields_and_whitespace(self, mock_conn_cls):
+        """Fields are found regardless of order, spacing and extra keys."""
+        body = (b'{"_id": "x", "author" : "Seneca", "tags": ["wisdom"],\n'
+                b' "content":"Luck is what happens when preparation meets '
+                b'opportunity. ", "length": 58}')
+        mock_connection(mock_conn_cls, body)
+
+        result = fetch_quote()
+        self.assertEqual(result.content, "Luck is what happens when "
+                                         "preparation meets opportunity.")
+        self.assertEqual(result.author, "Seneca")
+
+    @patch(CONN_PATCH)
+    def test_reuses_connection(self, mock_conn_cls):
+        """Consecutive fetches share one kept-alive connection."""
+        body = json.dumps({"content": "Again."}).encode("utf-8")
+        mock_conn = mock_connection(mock_conn_cls, body)
+
+        fetch_quote()
+        fetch_quote()
+        self.assertEqual(mock_conn_cls.call_count, 1)
+        self.assertEqual(mock_conn.request.call_count, 2)
+
+    @patch(CONN_PATCH)
+    def test_drops_connection_the_server_closes(self, mock_conn_cls):
+        """A response marked Connection: close is not reused."""
+        body = json.dumps({"content": "Again."}).encode("utf-8")
+        mock_conn = mock_connection(mock_conn_cls, body)
+        mock_conn.getresponse.return_value.will_close = True
+
+        fetch_quote()
+        fetch_quote()
+        self.assertEqual(mock_conn_cls.call_count, 2)
+        self.assertEqual(mock_conn.request.call_count, 2)
+
+    @patch(CONN_PATCH)
+    def test_reconnects_when_kept_alive_connection_dropped(self, mock_conn_cls):
+        """A connection closed by the server is replaced transparently."""
+        body = json.dumps({"content": "Again."}).encode("utf-8")
+        mock_conn = mock_connection(mock_conn_cls, body)
+        fetch_quote()
+
+        mock_conn.request.side_effect = [ConnectionResetError("reset"), None]
+        result = fetch_quote()
+        self.assertEqual(result.content, "Again.")
+        self.assertEqual(mock_conn_cls.call_count, 2)
+
+    @patch(CONN_PATCH)
+    def test_falls_back_to_unverified_ssl(self, mock_conn_cls):
+        """Certificate failures retry with an unverified SSL context."""
+        body = json.dumps({"content": "Insecure."}).encode("utf-8")
+        mock_conn = mock_connection(mock_conn_cls, body)
+        mock_conn.request.side_effect = [
+            ssl.SSLCertVerificationError("bad cert"), None,
+        ]
+
+        result = fetch_quote()
+        self.assertEqual(result.content, "Insecure.")
+        context = mock_conn_cls.call_args.kwargs["context"]
+        self.assertEqual(context.verify_mode, ssl.CERT_NONE)
+
+    @patch(CONN_PATCH)
+    def test_unverified_ssl_is_not_kept(self, mock_conn_cls):
+        """The fetch after a certificate failure verifies again."""
+        body = json.dumps({"content": "Insecure."}).encode("utf-8")
+        mock_conn = mock_connection(mock_conn_cls, body)
+        mock_conn.request.side_effect = [
+            ssl.SSLCertVerificationError("bad cert"), None, None,
+        ]
+
+        fetch_quote()
+        fetch_quote()
+        self.assertEqual(mock_conn_cls.call_count, 3)
+        self.assertIsNone(mock_conn_cls.call_args.kwargs["context"])
+
+
+class TestOfflineQuote(unittest.TestCase):
+    """Tests for the bundled offline quotes."""
+
+    def test_returns_bundled_quote(self):
+        self.assertIn(offline_quote(), QUOTES)
+
+    def test_bundled_quotes_are_typeable(self):
+        """Every bundled quote uses only printable ASCII characters."""
+        for quote in QUOTES:
+            self.assertTrue(all(32 <= ord(c) <= 126 for c in quote.content),
+                            quote.content)
+            self.assertTrue(quote.author)
+
 
 class TestQuote(unittest.TestCase):
     """Tests for the Quote namedtuple."""
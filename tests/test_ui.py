@@ -0,0 +1,174 @@
+"""Tests for the ui module."""
+
+import unittest
+from unittest.mock import patch
+from typeracer.game import GameState
+from typeracer.quotes import Quote
+from typeracer import ui
+from typeracer.ui import (
+    _draw_chars, _draw_stats, _game_layout, _wrapped_layout, stats_due_in,
+    wrap_text,
+)
+
+
+class TestWrapText(unittest.TestCase):
+    """Tests for wrap_text()."""
+
+    def test_short_text_is_one_line(self):
+        self.assertEqual(wrap_text("Hello world.", 20), ["Hello world."])
+
+    def test_wraps_at_word_boundaries(self):
+        """Lines break between words and never exceed the width."""
+        text = "The quick brown fox jumps over the lazy dog."
+        lines = wrap_text(text, 15)
+        self.assertEqual(lines, ["The quick brown", "fox jumps over",
+                                 "the lazy dog."])
+        self.assertEqual(" ".join(lines), text)
+
+    def test_exact_fit(self):
+        """A line exactly as wide as the limit is not broken."""
+        self.assertEqual(wrap_text("abc def", 7), ["abc def"])
+        self.assertEqual(wrap_text("abc def", 6), ["abc", "def"])
+
+    def test_long_word_gets_own_line(self):
+        """A word wider than the limit is placed alone, not split."""
+        self.assertEqual(wrap_text("a verylongword b", 5),
+                         ["a", "verylongword", "b"])
+
+    def test_empty_text(self):
+        self.assertEqual(wrap_text("", 10), [])
+
+
+class TestWrappedLayout(unittest.TestCase):
+    """Tests for the cached per-character layout."""
+
+    @patch("typeracer.game.fetch_quote",
+           return_value=Quote("The quick brown fox", "Test Author"))
+    def test_offsets_and_cache(self, _mock):
+        """Each char maps to its row and column; results are reused."""
+        game = GameState()
+        lines, rows, cols = _wrapped_layout(game, 10)
+        self.assertEqual(lines, ["The quick", "brown fox"])
+        # The dropped space at the wrap closes the first line
+        self.assertEqual(list(rows), [0] * 10 + [2] * 9)
+        self.assertEqual(list(cols), list(range(10)) + list(range(9)))
+        self.assertIs(_wrapped_layout(game, 10)[0], lines)
+
+        game.invalidate_layout()
+        self.assertIsNot(_wrapped_layout(game, 10)[0], lines)
+
+
+class RecordingWindow:
+    """Stand-in for a curses window that records addstr calls."""
+
+    def __init__(self, width=80, height=24):
+        self.width = width
+        self.height = height
+        self.calls = []
+
+    def getmaxyx(self):
+        return (self.height, self.width)
+
+    def addnstr(self, y, x, text, n, attr=0):
+        self.calls.append((y, x, text[:n], attr))
+
+    def move(self, y, x):
+        pass
+
+    def clrtoeol(self):
+        pass
+
+    def noutrefresh(self):
+        pass
+
+
+class TestDrawChars(unittest.TestCase):
+    """Tests for run-batched character rendering."""
+
+    # init_colors() needs a terminal, so give each attribute its own value
+    @patch.multiple(ui, ATTR_CORRECT=1, ATTR_INCORRECT=2, ATTR_CURSOR=3,
+                    ATTR_UNTYPED=4)
+    @patch("typeracer.game.fetch_quote",
+           return_value=Quote("The quick brown fox", "Test Author"))
+    def test_one_call_per_run(self, _mock):
+        """Characters sharing a row and attribute are written together."""
+        game = GameState()
+        for char in "Thx":
+            game.type_char(char)
+        _, rows, cols = _wrapped_layout(game, 10)
+
+        win = RecordingWindow()
+        _draw_chars(win, game, 0, len(game.target), 3, rows, cols, 10)
+        self.assertEqual(win.calls, [
+            (0, 3, "Th", 1),
+            (0, 5, "e", 2),
+            (0, 6, " ", 3),
+            (0, 7, "quick ", 4),
+            (2, 3, "brown fox", 4),
+        ])
+
+    @patch.multiple(ui, ATTR_CURSOR=3, ATTR_UNTYPED=4)
+    @patch("typeracer.game.fetch_quote",
+           return_value=Quote("The quick brown fox", "Test Author"))
+    def test_clips_to_window(self, _mock):
+        """Rows below max_row are skipped and runs stop at the window edge."""
+        game = GameState()
+        _, rows, cols = _wrapped_layout(game, 10)
+
+        win = RecordingWindow(width=8)
+        _draw_chars(win, game, 0, len(game.target), 3, rows, cols, 2)
+        self.assertEqual(win.calls, [(0, 3, "T", 3), (0, 4, "he q", 4)])
+
+
+class TestDrawStats(unittest.TestCase):
+    """Tests for the stats line and progress bar."""
+
+    @patch("typeracer.game.fetch_quote",
+           return_value=Quote("The quick brown fox", "Test Author"))
+    def test_narrow_terminal_stays_inside_window(self, _mock):
+        """On a terminal narrower than the stats line, writes are clipped."""
+        game = GameState()
+        layout = _game_layout(RecordingWindow(width=20), game)
+        stats_win = RecordingWindow(width=20, height=2)
+        game._subwins = (stats_win, None, None)
+
+        _draw_stats(game, layout, True)
+        game.type_char("T")
+        _draw_stats(game, layout, False)
+
+        self.assertTrue(stats_win.calls)
+        for y, x, text, _attr in stats_win.calls:
+            self.assertLess(y, 2)
+            # The bottom-right cell cannot be written without an error
+            room = 20 - x - (y == 1)
+            self.assertLessEqual(len(text), room)
+
+    @patch("typeracer.ui.time")
+    @patch("typeracer.game.fetch_quote",
+           return_value=Quote("The quick brown fox", "Test Author"))
+    def test_deferred_update_is_flushed(self, _mock, mock_time):
+        """A stats rebuild skipped by the rate limit is shown once due."""
+        mock_time.monotonic.return_value = 100.0
+        game = GameState()
+        layout = _game_layout(RecordingWindow(), game)
+        stats_win = RecordingWindow(height=2)
+        game._subwins = (stats_win, None, None)
+        _draw_stats(game, layout, True)
+        self.assertIsNone(stats_due_in(game))
+
+        # A keystroke right after the last rebuild is not shown yet
+        game.type_char("x")
+        mock_time.monotonic.return_value = 100.001
+        _draw_stats(game, layout, False)
+        self.assertIn("ACC:   ---", game._last_stats)
+        self.assertAlmostEqual(stats_due_in(game), 0.099)
+
+        # The redraw after that wait brings the line up to date
+        mock_time.monotonic.return_value = 100.101
+        _draw_stats(game, layout, False)
+        self.assertIn("ACC:   0.0%", game._last_stats)
+        self.assertIsNone(stats_due_in(game))
+
+
+if __name__ == "__main__":
+    unittest.main()